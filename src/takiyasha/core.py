@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import shutil
 from pathlib import Path
 from typing import Generator, IO
 
@@ -110,9 +111,9 @@ def decrypt(srcfilepath: Path,
     if crypter.seekable():
         crypter.seek(0, 0)
 
-    # 从 crypter 中读取（解密）数据，并写入 destfile
+    # 从 crypter 中分块读取（解密）数据，并写入 destfile，避免在内存中保留整个解密结果
     try:
-        destfile.write(crypter.read())
+        shutil.copyfileobj(crypter, destfile)
     except Exception as exc:
         # 捕获到任何异常时，关闭和删除 destfile
         utils.error(f"解密输入文件 '{srcfilepath}' 到 '{destfilepath}' 时："
@@ -61,7 +61,8 @@ def entry(argv: list[str] | None = None) -> int:
         utils.warn("您正处于并行处理模式，"
                    "这可能导致 CPU、RAM 等系统资源消耗急剧上升！"
                    )
-        max_processes = mp.cpu_count() // 2  # 例如，使用与CPU核心数相等的进程数
+        # 使用 CPU 核心数一半的进程数，但至少为 1，否则单核机器上会因无进程可等待而出错
+        max_processes = max(1, mp.cpu_count() // 2)
         with mp.Manager() as mgr:
             status_pool: list[bool] = mgr.list()
             procs = []